@@ -7,51 +7,150 @@ Simplified pipeline with 3 specific workflows for AI agent usage:
 2. Clear edited: Clear timeline_edited folder
 3. Import workflow: Convert JSON to OTIO → Import to Resolve
 
-Designed to be called programmatically by AI agents.
+Designed to be called programmatically by AI agents. Each workflow is
+available as a coroutine (``*_async``) so several workflows can run
+concurrently in one interpreter, plus a blocking wrapper for simple callers.
 """
 
 import sys
 import os
-import subprocess
+import array
+import asyncio
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Callable, Literal, TypedDict
+
+from importotio import configure_logging, import_otio_timeline
+
+
+class BatchOp(TypedDict):
+    """A single operation for DataPipeline.run_batch."""
+    kind: Literal["clear", "export", "convert", "import"]
+    args: Dict[str, Any]
+
+
+# Folders with at least this many files are cleared using a thread pool
+_PARALLEL_UNLINK_THRESHOLD = 64
+_UNLINK_WORKERS = 16
+
+# Directories already created or confirmed to exist in this process
+_ensured_dirs: Set[str] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _script_dir() -> Path:
+    """Resolved directory containing the pipeline scripts (computed once)."""
+    return Path(__file__).parent.resolve()
+
+
+@functools.lru_cache(maxsize=None)
+def _default_project_root() -> Path:
+    """Project root auto-detected from the script location (computed once)."""
+    return _script_dir().parent.parent  # Go up from backend/python_services/services/resolveautomation
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_project_root(project_root: str) -> Path:
+    """Resolved form of an absolute project root (computed once per path)."""
+    return Path(project_root).resolve()
+
+
+@functools.lru_cache(maxsize=None)
+def _pipeline_dirs(project_root: Path) -> tuple[Path, Path, Path]:
+    """Data, timeline_ref and timeline_edited directories for a project root."""
+    data_dir = project_root / "data" / "timelineprocessing"
+    return data_dir, data_dir / "timeline_ref", data_dir / "timeline_edited"
 
 
 class DataPipeline:
     """Simplified data pipeline for AI agent usage."""
     
-    def __init__(self, project_root: Optional[str] = None):
+    def __init__(self, project_root: Optional[str] = None, verbose: bool = False):
         """
         Initialize the data pipeline.
         
         Args:
             project_root: Path to project root (optional, auto-detected if not provided)
+            verbose: List every deleted file when clearing folders (optional, default False)
         """
+        self.verbose = verbose
+        
+        # Honour OTIO_PIPELINE_LOG_LEVEL (no-op if the caller already set up logging)
+        configure_logging()
+        
         # Determine project root
         if project_root:
-            self.project_root = Path(project_root).resolve()
+            self.project_root = _resolve_project_root(os.path.abspath(project_root))
         else:
             # Auto-detect project root from script location
-            script_dir = Path(__file__).parent.resolve()
-            self.project_root = script_dir.parent.parent  # Go up from backend/python_services/services/resolveautomation
+            self.project_root = _default_project_root()
         
         # Define standard directories
-        self.data_dir = self.project_root / "data" / "timelineprocessing"
-        self.timeline_ref_dir = self.data_dir / "timeline_ref"
-        self.timeline_edited_dir = self.data_dir / "timeline_edited"
-        self.scripts_dir = Path(__file__).parent
+        self.data_dir, self.timeline_ref_dir, self.timeline_edited_dir = _pipeline_dirs(self.project_root)
+        self.scripts_dir = _script_dir()
+        
+        # String forms of the paths above, used for subprocess arguments and output
+        self.project_root_str = os.fspath(self.project_root)
+        self.timeline_ref_dir_str = os.fspath(self.timeline_ref_dir)
+        self.timeline_edited_dir_str = os.fspath(self.timeline_edited_dir)
+        self.scripts_dir_str = os.fspath(self.scripts_dir)
+        
+        # Environment for child scripts (fixes Unicode encoding issues on Windows)
+        self._child_env = {**os.environ, "PYTHONIOENCODING": "utf-8"}
         
         # Ensure directories exist
         self._ensure_directories()
     
     def _ensure_directories(self) -> None:
-        """Ensure all required directories exist."""
+        """Ensure all required directories exist (checked once per process)."""
         for directory in [self.data_dir, self.timeline_ref_dir, self.timeline_edited_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
+            directory_str = os.fspath(directory)
+            if directory_str in _ensured_dirs:
+                continue
+            if not os.path.isdir(directory_str):
+                directory.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(directory_str)
+    
+    def _call_step(self, func: Callable[..., bool], **kwargs: Any) -> bool:
+        """
+        Run a pipeline step in-process.
+        
+        Args:
+            func: Step function to call (must return True on success)
+            **kwargs: Keyword arguments to pass to the step function
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        print(f"Running: {func.__module__}.{func.__name__}")
+        try:
+            return bool(func(**kwargs))
+        except Exception as e:
+            print(f"ERROR: Step {func.__name__} failed: {e}")
+            return False
     
-    def _run_script(self, script_name: str, args: List[str]) -> bool:
+    async def _call_step_async(self, func: Callable[..., bool], **kwargs: Any) -> bool:
         """
-        Run a script with arguments.
+        Run an in-process pipeline step in a worker thread.
+        
+        Args:
+            func: Step function to call (must return True on success)
+            **kwargs: Keyword arguments to pass to the step function
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self._call_step, func, **kwargs)
+    
+    async def _run_script_async(self, script_name: str, args: List[str]) -> bool:
+        """
+        Run a script with arguments in a separate Python process.
+        
+        Only used for steps that are not importable in-process. The current
+        interpreter is reused instead of `uv run` so the environment is not
+        re-resolved for every step.
         
         Args:
             script_name: Name of the script to run
@@ -60,29 +159,18 @@ class DataPipeline:
         Returns:
             True if successful, False otherwise
         """
-        script_path = self.scripts_dir / script_name
-        if not script_path.exists():
+        script_path = os.path.join(self.scripts_dir_str, script_name)
+        if not os.path.exists(script_path):
             print(f"ERROR: Script not found: {script_path}")
             return False
         
         # Build command
-        cmd = ["uv", "run", str(script_path)] + args
+        cmd = [sys.executable, script_path] + args
         
         print(f"Running: {' '.join(cmd)}")
         try:
-            # Fix Unicode encoding issues on Windows
-            env = os.environ.copy()
-            env['PYTHONIOENCODING'] = 'utf-8'
-            
-            result = subprocess.run(
-                cmd, 
-                capture_output=False, 
-                text=True,
-                encoding='utf-8',
-                env=env,
-                errors='replace'  # Replace problematic characters instead of crashing
-            )
-            return result.returncode == 0
+            process = await asyncio.create_subprocess_exec(*cmd, env=self._child_env, stdout=None, stderr=None)
+            return await process.wait() == 0
         except Exception as e:
             print(f"ERROR: Failed to run script: {e}")
             return False
@@ -99,24 +187,80 @@ class DataPipeline:
         """
         try:
             print(f"Clearing directory: {directory}")
-            file_count = 0
-            for file in directory.glob("*"):
-                if file.is_file():
-                    file.unlink()
-                    file_count += 1
-                    print(f"  Deleted: {file.name}")
+            deleted_names = []
+            deleted_paths = []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        deleted_names.append(entry.name)
+                        deleted_paths.append(entry.path)
+            
+            # Large folders are deleted from a thread pool so unlink latency
+            # (network shares, Docker mounts) overlaps
+            if len(deleted_paths) >= _PARALLEL_UNLINK_THRESHOLD:
+                with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as executor:
+                    list(executor.map(os.unlink, deleted_paths))
+            else:
+                for path in deleted_paths:
+                    os.unlink(path)
             
-            if file_count == 0:
+            if not deleted_names:
                 print("  Directory was already empty")
             else:
-                print(f"  Deleted {file_count} files")
+                # Per-file lines are written in one go, and only when verbose
+                if self.verbose:
+                    sys.stdout.write("".join(f"  Deleted: {name}\n" for name in deleted_names))
+                print(f"  Deleted {len(deleted_names)} files")
             
             return True
         except Exception as e:
             print(f"ERROR: Failed to clear directory {directory}: {e}")
             return False
     
-    def workflow_1_export(self, timeline_name: Optional[str] = None) -> bool:
+    def _scan_outputs(self, directory: Path, ext: str) -> List[Path]:
+        """
+        List the files with an extension in a single scan, newest first.
+        
+        The directory is scanned on every call, since scripts rewrite files in
+        place. Modification times come from the DirEntry, which reuses the
+        directory listing on Windows instead of issuing a stat per file.
+        
+        Args:
+            directory: Directory to scan
+            ext: Extension without dot (e.g. "otio", "json")
+            
+        Returns:
+            Paths of the matching files, most recently modified first
+        """
+        suffix = "." + ext
+        with os.scandir(directory) as entries:
+            found = [
+                (entry.stat().st_mtime, entry.path) for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(suffix)
+            ]
+        found.sort(reverse=True)
+        return [Path(path) for _, path in found]
+    
+    async def _clear_directory_async(self, directory: Path) -> bool:
+        """Clear a directory in a worker thread so other steps can proceed."""
+        return await asyncio.to_thread(self._clear_directory, directory)
+    
+    async def _precompute_export_paths(self, timeline_name: Optional[str] = None) -> List[str]:
+        """
+        Build the exportotio.py arguments while the export folder is being cleared.
+        
+        Args:
+            timeline_name: Specific timeline name to export (optional)
+            
+        Returns:
+            List of arguments for exportotio.py
+        """
+        export_args = ["--output", os.path.join(self.timeline_ref_dir_str, "exported_timeline.otio")]
+        if timeline_name:
+            export_args.extend(["--timeline", timeline_name])
+        return export_args
+    
+    async def workflow_1_export_async(self, timeline_name: Optional[str] = None) -> bool:
         """
         Workflow 1: Export timeline from Resolve and convert to JSON.
         
@@ -133,21 +277,20 @@ class DataPipeline:
         """
         print("=== WORKFLOW 1: EXPORT TIMELINE FROM RESOLVE ===")
         
-        # Step 1: Clear timeline_ref folder
+        # Step 1: Clear timeline_ref folder (export arguments are built meanwhile)
         print("Step 1: Clearing timeline_ref folder")
-        if not self._clear_directory(self.timeline_ref_dir):
+        cleared, export_args = await asyncio.gather(
+            self._clear_directory_async(self.timeline_ref_dir),
+            self._precompute_export_paths(timeline_name),
+        )
+        if not cleared:
             return False
         print()
         
         # Step 2: Export OTIO from Resolve
         print("Step 2: Exporting OTIO from DaVinci Resolve")
         
-        # Build export arguments
-        export_args = ["--output", str(self.timeline_ref_dir / "exported_timeline.otio")]
-        if timeline_name:
-            export_args.extend(["--timeline", timeline_name])
-        
-        if not self._run_script("exportotio.py", export_args):
+        if not await self._run_script_async("exportotio.py", export_args):
             print("[ERROR] OTIO export failed")
             return False
         
@@ -158,7 +301,7 @@ class DataPipeline:
         print("Step 3: Converting OTIO to JSON")
         
         # Find the exported OTIO file
-        otio_files = list(self.timeline_ref_dir.glob("*.otio"))
+        otio_files = self._scan_outputs(self.timeline_ref_dir, "otio")
         if not otio_files:
             print("ERROR: No OTIO file found after export")
             return False
@@ -166,7 +309,7 @@ class DataPipeline:
         otio_file = otio_files[0]  # Should only be one since we cleared the directory
         json_args = [str(otio_file)]
         
-        if not self._run_script("otio2json.py", json_args):
+        if not await self._run_script_async("otio2json.py", json_args):
             print("[ERROR] OTIO to JSON conversion failed")
             return False
         
@@ -174,7 +317,7 @@ class DataPipeline:
         print()
         
         # Find the generated JSON file
-        json_files = list(self.timeline_ref_dir.glob("*.json"))
+        json_files = self._scan_outputs(self.timeline_ref_dir, "json")
         if json_files:
             json_file = json_files[0]
             print(f"[OK] Workflow 1 completed successfully!")
@@ -184,7 +327,11 @@ class DataPipeline:
             print("ERROR: No JSON file found after conversion")
             return False
     
-    def workflow_2_clear_edited(self) -> bool:
+    def workflow_1_export(self, timeline_name: Optional[str] = None) -> bool:
+        """Blocking wrapper around workflow_1_export_async."""
+        return asyncio.run(self.workflow_1_export_async(timeline_name))
+    
+    async def workflow_2_clear_edited_async(self) -> bool:
         """
         Workflow 2: Clear timeline_edited folder.
         
@@ -193,14 +340,18 @@ class DataPipeline:
         """
         print("=== WORKFLOW 2: CLEAR TIMELINE_EDITED FOLDER ===")
         
-        success = self._clear_directory(self.timeline_edited_dir)
+        success = await self._clear_directory_async(self.timeline_edited_dir)
         
         if success:
             print("[OK] Workflow 2 completed successfully!")
         
         return success
     
-    def workflow_3_import(self, timeline_name: Optional[str] = None, import_clips: bool = False) -> bool:
+    def workflow_2_clear_edited(self) -> bool:
+        """Blocking wrapper around workflow_2_clear_edited_async."""
+        return asyncio.run(self.workflow_2_clear_edited_async())
+    
+    async def workflow_3_import_async(self, timeline_name: Optional[str] = None, import_clips: bool = False) -> bool:
         """
         Workflow 3: Convert JSON to OTIO and import to Resolve.
         
@@ -221,7 +372,7 @@ class DataPipeline:
         print("Step 1: Converting JSON to OTIO")
         
         # Find JSON file in timeline_edited
-        json_files = list(self.timeline_edited_dir.glob("*.json"))
+        json_files = self._scan_outputs(self.timeline_edited_dir, "json")
         if not json_files:
             print("ERROR: No JSON files found in timeline_edited directory")
             print(f"Please place your edited JSON file in: {self.timeline_edited_dir}")
@@ -230,13 +381,13 @@ class DataPipeline:
         if len(json_files) > 1:
             print(f"WARNING: Multiple JSON files found, using most recent: {[f.name for f in json_files]}")
         
-        json_file = max(json_files, key=lambda f: f.stat().st_mtime)
+        json_file = json_files[0]
         print(f"Using JSON file: {json_file.name}")
         
         # Convert JSON to OTIO
-        json2otio_args = [str(json_file), "--project-root", str(self.project_root)]
+        json2otio_args = [str(json_file), "--project-root", self.project_root_str]
         
-        if not self._run_script("json2otio.py", json2otio_args):
+        if not await self._run_script_async("json2otio.py", json2otio_args):
             print("[ERROR] JSON to OTIO conversion failed")
             return False
         
@@ -247,22 +398,22 @@ class DataPipeline:
         print("Step 2: Importing OTIO into DaVinci Resolve")
         
         # Find the generated OTIO file
-        otio_files = list(self.timeline_edited_dir.glob("*.otio"))
+        otio_files = self._scan_outputs(self.timeline_edited_dir, "otio")
         if not otio_files:
             print("ERROR: No OTIO file found after conversion")
             return False
         
-        otio_file = max(otio_files, key=lambda f: f.stat().st_mtime)
+        otio_file = otio_files[0]
         print(f"Using OTIO file: {otio_file.name}")
         
-        # Import OTIO
-        import_args = [str(otio_file)]
-        if timeline_name:
-            import_args.extend(["--name", timeline_name])
-        if import_clips:
-            import_args.append("--import-clips")
-        
-        if not self._run_script("importotio.py", import_args):
+        # Import OTIO (in-process, no extra interpreter start-up)
+        if not await self._call_step_async(
+            import_otio_timeline,
+            otio_file_path=str(otio_file),
+            timeline_name=timeline_name,
+            import_source_clips=import_clips,
+            verbose=self.verbose,
+        ):
             print("[ERROR] OTIO import failed")
             return False
         
@@ -273,40 +424,190 @@ class DataPipeline:
         
         return True
     
+    def workflow_3_import(self, timeline_name: Optional[str] = None, import_clips: bool = False) -> bool:
+        """Blocking wrapper around workflow_3_import_async."""
+        return asyncio.run(self.workflow_3_import_async(timeline_name, import_clips))
+    
+    async def _run_op_async(self, op: BatchOp) -> bool:
+        """
+        Run a single batch operation.
+        
+        Args:
+            op: Operation to run. Supported kinds and their args:
+                clear   - {"directory": "timeline_ref" | "timeline_edited"}
+                export  - workflow_1_export arguments
+                convert - {"input": path}; .otio files go through otio2json.py,
+                          .json files through json2otio.py
+                import  - workflow_3_import arguments
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        kind = op.get("kind")
+        args = op.get("args", {})
+        
+        try:
+            if kind == "clear":
+                directory = self._named_directory(args.get("directory", ""))
+                if directory is None:
+                    print(f"ERROR: Unknown directory for clear: {args.get('directory')}")
+                    return False
+                return await self._clear_directory_async(directory)
+            if kind == "export":
+                return await self.workflow_1_export_async(**args)
+            if kind == "convert":
+                input_file = args.get("input")
+                if not input_file:
+                    print("ERROR: convert operation needs an 'input' path")
+                    return False
+                input_path = Path(input_file)
+                if input_path.suffix.lower() == ".otio":
+                    return await self._run_script_async("otio2json.py", [str(input_path)])
+                return await self._run_script_async(
+                    "json2otio.py", [str(input_path), "--project-root", self.project_root_str]
+                )
+            if kind == "import":
+                return await self.workflow_3_import_async(**args)
+        except Exception as e:
+            print(f"ERROR: Batch operation {kind} failed: {e}")
+            return False
+        
+        print(f"ERROR: Unknown batch operation: {kind}")
+        return False
+    
+    def _named_directory(self, name: str) -> Optional[Path]:
+        """Map a pipeline directory name to its path."""
+        return {
+            "timeline_ref": self.timeline_ref_dir,
+            "timeline_edited": self.timeline_edited_dir,
+        }.get(name)
+    
+    def _op_directories(self, op: BatchOp) -> Set[str]:
+        """
+        Directories a batch operation reads or writes.
+        
+        Args:
+            op: Batch operation
+            
+        Returns:
+            Normalized directory paths; unknown operations touch every pipeline folder
+        """
+        kind = op.get("kind")
+        args = op.get("args", {})
+        
+        if kind == "clear":
+            directory = self._named_directory(args.get("directory", ""))
+            paths = [directory] if directory is not None else []
+        elif kind == "export":
+            paths = [self.timeline_ref_dir]
+        elif kind == "import":
+            paths = [self.timeline_edited_dir]
+        elif kind == "convert":
+            # json2otio.py writes into timeline_edited whatever the input location
+            input_file = args.get("input")
+            paths = []
+            if input_file:
+                input_path = Path(input_file)
+                paths.append(input_path.parent)
+                if input_path.suffix.lower() != ".otio":
+                    paths.append(self.timeline_edited_dir)
+        else:
+            paths = [self.timeline_ref_dir, self.timeline_edited_dir]
+        
+        return {os.path.normcase(os.path.abspath(path)) for path in paths}
+    
+    async def run_batch_async(self, operations: List[BatchOp]) -> List[bool]:
+        """
+        Run several pipeline operations in one dispatch.
+        
+        Operations keep their submission order. Consecutive operations that
+        touch different directories run concurrently; an operation touching a
+        directory used earlier in the current wave starts a new wave. A clear
+        that repeats the previous operation on the same directory reuses its
+        result instead of running again. An operation that fails or raises
+        reports False without affecting the others.
+        
+        Args:
+            operations: Operations to run
+            
+        Returns:
+            One success flag per operation, in the order given
+        """
+        results: List[bool] = [False] * len(operations)
+        
+        # Split into waves of operations with disjoint directories
+        waves: List[List[int]] = []
+        wave_dirs: Set[str] = set()
+        last_op_by_dir: Dict[str, int] = {}
+        repeats: Dict[int, int] = {}
+        for i, op in enumerate(operations):
+            directories = self._op_directories(op)
+            
+            if op.get("kind") == "clear" and directories:
+                (directory,) = directories
+                previous = last_op_by_dir.get(directory)
+                if previous is not None and operations[previous] == op:
+                    repeats[i] = previous
+                    continue
+            
+            if not waves or directories & wave_dirs:
+                waves.append([])
+                wave_dirs = set()
+            waves[-1].append(i)
+            wave_dirs |= directories
+            for directory in directories:
+                last_op_by_dir[directory] = i
+        
+        for wave in waves:
+            outcomes = await asyncio.gather(*(self._run_op_async(operations[i]) for i in wave))
+            for i, outcome in zip(wave, outcomes):
+                results[i] = outcome
+        
+        for i, previous in repeats.items():
+            results[i] = results[previous]
+        
+        return results
+    
+    def run_batch(self, operations: List[BatchOp]) -> List[bool]:
+        """Blocking wrapper around run_batch_async."""
+        return asyncio.run(self.run_batch_async(operations))
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get current status of pipeline directories.
         
         Returns:
-            Dictionary with status information
+            Dictionary with status information. File details are given as
+            parallel lists: files["name"][i], files["size"][i] and
+            files["modified"][i] describe the same file.
         """
-        def get_dir_info(directory: Path) -> Dict[str, Any]:
-            files = list(directory.glob("*"))
-            file_info = []
-            for file in files:
-                if file.is_file():
-                    file_info.append({
-                        "name": file.name,
-                        "size": file.stat().st_size,
-                        "modified": file.stat().st_mtime
-                    })
-            return {
-                "path": str(directory),
-                "file_count": len(file_info),
-                "files": file_info
+        status: Dict[str, Any] = {"project_root": self.project_root_str}
+        
+        # Visit both pipeline directories in a single pass
+        for key, directory in (("timeline_ref", self.timeline_ref_dir_str),
+                               ("timeline_edited", self.timeline_edited_dir_str)):
+            names: List[str] = []
+            sizes = array.array("q")
+            mtimes = array.array("d")
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        st = entry.stat()
+                        names.append(entry.name)
+                        sizes.append(st.st_size)
+                        mtimes.append(st.st_mtime)
+            status[key] = {
+                "path": directory,
+                "file_count": len(names),
+                "files": {"name": names, "size": sizes.tolist(), "modified": mtimes.tolist()}
             }
         
-        return {
-            "project_root": str(self.project_root),
-            "timeline_ref": get_dir_info(self.timeline_ref_dir),
-            "timeline_edited": get_dir_info(self.timeline_edited_dir)
-        }
+        return status
 
 
-def main():
-    """Main function for command-line testing."""
-    import argparse
-    
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
         description="Data Pipeline for DaVinci Resolve OTIO Workflow - AI Agent Version",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -332,15 +633,21 @@ Examples:
     parser.add_argument('--timeline', '-t', help='Timeline name (for workflow-1)')
     parser.add_argument('--name', '-n', help='Name for imported timeline (for workflow-3)')
     parser.add_argument('--import-clips', action='store_true', help='Import source clips (for workflow-3)')
+    parser.add_argument('--verbose', '-v', action='store_true', help='List every deleted file when clearing folders')
     parser.add_argument('--version', action='version', version='%(prog)s 1.0.0')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main function for command-line testing."""
+    args = _build_parser().parse_args()
     
     print("=== DaVinci Resolve OTIO Data Pipeline - AI Agent Version ===")
     print()
     
     # Initialize pipeline
-    pipeline = DataPipeline(args.project_root)
+    pipeline = DataPipeline(args.project_root, verbose=args.verbose)
     
     # Execute workflow
     success = True
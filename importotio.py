@@ -8,137 +8,464 @@ No hardcoded paths - designed to be used by datapipeline.py or standalone.
 
 import sys
 import os
+import re
 import json
 import argparse
+import functools
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, Set
 
-
-def get_unique_timeline_name(project, base_timeline_name: str) -> str:
-    """Get a unique timeline name by appending suffix if needed."""
+# Use a faster JSON parser for OTIO analysis when one is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
     try:
-        timeline_count = project.GetTimelineCount()
-        existing_names = set()
+        from ujson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
+# Stream OTIO files instead of loading them whole when ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+log = logging.getLogger(__name__)
+
+# OTIO key holding a media reference's file path (interned for dict lookups in the walk)
+_TARGET_URL = sys.intern("target_url")
+_TARGET_URL_SUFFIX = "." + _TARGET_URL
+
+# Environment variable holding the log level for the pipeline scripts
+LOG_LEVEL_ENV_VAR = "OTIO_PIPELINE_LOG_LEVEL"
+
+
+def configure_logging() -> None:
+    """Configure logging from the OTIO_PIPELINE_LOG_LEVEL environment variable (default WARNING)."""
+    level_name = os.environ.get(LOG_LEVEL_ENV_VAR, "WARNING").upper()
+    level = logging.getLevelName(level_name)
+    logging.basicConfig(level=level if isinstance(level, int) else logging.WARNING)
+
+
+# Media analysis results, keyed by OTIO path and reused while size and mtime match
+# (stored under ~/.cache, see _analysis_cache_file)
+# Bump when the analysis result changes so older cached entries are recomputed
+_ANALYSIS_CACHE_VERSION = 3
+# Most recently analyzed files kept in the cache
+_ANALYSIS_CACHE_MAX_ENTRIES = 64
+
+# Analysis cache contents, loaded from disk on first use
+_analysis_cache: Optional[Dict[str, Any]] = None
+
+# DaVinci Resolve scripting connection, created on first use
+_resolve_app = None
+
+
+def _get_resolve():
+    """
+    Get the DaVinci Resolve scripting connection, connecting on first use.
+    
+    Returns:
+        Resolve application object, or None if it could not connect
+        
+    Raises:
+        ImportError: If the DaVinciResolveScript module is not available
+    """
+    global _resolve_app
+    if _resolve_app is None:
+        print("Importing DaVinci Resolve API...")
+        import DaVinciResolveScript as dvr_script
+        print("[OK] DaVinciResolveScript module imported successfully")
         
-        # Collect all existing timeline names
-        for i in range(1, timeline_count + 1):
-            existing_timeline = project.GetTimelineByIndex(i)
-            if existing_timeline:
-                existing_names.add(existing_timeline.GetName())
+        print("Connecting to DaVinci Resolve...")
+        _resolve_app = dvr_script.scriptapp("Resolve")
+    return _resolve_app
+
+
+def force_reconnect():
+    """
+    Drop the cached DaVinci Resolve connection and connect again.
+    
+    Returns:
+        Resolve application object, or None if it could not connect
+    """
+    global _resolve_app
+    _resolve_app = None
+    return _get_resolve()
+
+
+def _collect_existing_timeline_names(project) -> Set[str]:
+    """Collect the names of all timelines in the project (one pass over the API)."""
+    return {
+        existing_timeline.GetName()
+        for i in range(1, project.GetTimelineCount() + 1)
+        if (existing_timeline := project.GetTimelineByIndex(i))
+    }
+
+
+def get_unique_timeline_name(
+    project,
+    base_timeline_name: str,
+    existing_names: Optional[Set[str]] = None,
+    prefer_timestamp: bool = True
+) -> str:
+    """
+    Get a unique timeline name by appending suffix if needed.
+    
+    Args:
+        project: DaVinci Resolve project
+        base_timeline_name: Preferred timeline name
+        existing_names: Timeline names already in the project (collected if not provided)
+        prefer_timestamp: On a name conflict append a timestamp suffix (default) instead
+                          of the next free " (N)" suffix
+        
+    Returns:
+        Unique timeline name
+    """
+    try:
+        if existing_names is None:
+            existing_names = _collect_existing_timeline_names(project)
         
         # If base name doesn't exist, use it
         if base_timeline_name not in existing_names:
             return base_timeline_name
         
-        # Find a unique name by appending suffix
-        suffix = 1
-        while True:
-            candidate_name = f"{base_timeline_name} ({suffix})"
-            if candidate_name not in existing_names:
-                print(f"Timeline '{base_timeline_name}' already exists - using '{candidate_name}' instead")
-                return candidate_name
-            suffix += 1
-            
-            # Safety check to prevent infinite loop
-            if suffix > 1000:
-                print(f"Warning: Could not find unique name after 1000 attempts, using timestamp suffix")
-                import time
-                timestamp_suffix = int(time.time())
-                return f"{base_timeline_name}_{timestamp_suffix}"
+        if prefer_timestamp:
+            candidate_name = f"{base_timeline_name}_{int(time.time())}"
+            print(f"Timeline '{base_timeline_name}' already exists - using '{candidate_name}' instead")
+            return candidate_name
+        
+        # Continue after the highest existing "{base} (N)" suffix; only names
+        # with the right prefix need the regex
+        suffix_prefix = base_timeline_name + " ("
+        existing_with_prefix = [name for name in existing_names if name.startswith(suffix_prefix)]
+        max_suffix = 0
+        if existing_with_prefix:
+            suffix_pattern = re.compile(re.escape(suffix_prefix) + r"(\d+)\)$")
+            for name in existing_with_prefix:
+                match = suffix_pattern.match(name)
+                if match:
+                    max_suffix = max(max_suffix, int(match.group(1)))
+        
+        candidate_name = f"{base_timeline_name} ({max_suffix + 1})"
+        print(f"Timeline '{base_timeline_name}' already exists - using '{candidate_name}' instead")
+        return candidate_name
                 
     except Exception as e:
         print(f"Warning: Could not check existing timelines: {e}")
         # Fallback to timestamp suffix
-        import time
         timestamp_suffix = int(time.time())
         return f"{base_timeline_name}_{timestamp_suffix}"
 
 
-def display_timeline_info(timeline) -> None:
-    """Display imported timeline information."""
+def _count_track_items(timeline, track_counts: Dict[str, int]) -> Dict[str, int]:
+    """
+    Count the items on all tracks of the given types.
+    
+    Every track of every type is queried from one thread pool, so the
+    scripting API calls for video and audio tracks overlap.
+    
+    Args:
+        timeline: DaVinci Resolve timeline
+        track_counts: Number of tracks per track type (e.g. {"video": 2})
+        
+    Returns:
+        Total number of items per track type
+    """
+    tracks = [(track_type, track_idx)
+              for track_type, count in track_counts.items()
+              for track_idx in range(1, count + 1)]
+    totals = {track_type: 0 for track_type in track_counts}
+    if not tracks:
+        return totals
+    
+    with ThreadPoolExecutor(max_workers=min(len(tracks), 8)) as executor:
+        item_lists = executor.map(lambda track: timeline.GetItemListInTrack(*track), tracks)
+        for (track_type, _), items in zip(tracks, item_lists):
+            totals[track_type] += len(items)
+    return totals
+
+
+def display_timeline_info(timeline, verbose: bool = False) -> None:
+    """
+    Display imported timeline information.
+    
+    Args:
+        timeline: Imported DaVinci Resolve timeline
+        verbose: Also show start timecode and per-type item totals (one API call per track)
+    """
+    # Collected and written in one go rather than one print per line
+    lines = ["Timeline details:"]
     try:
-        print("Timeline details:")
-        print(f"  Name: {timeline.GetName()}")
-        print(f"  Duration: {timeline.GetEndFrame() - timeline.GetStartFrame() + 1} frames")
-        print(f"  Start frame: {timeline.GetStartFrame()}")
-        print(f"  End frame: {timeline.GetEndFrame()}")
-        print(f"  Start timecode: {timeline.GetStartTimecode()}")
+        start_frame = timeline.GetStartFrame()
+        end_frame = timeline.GetEndFrame()
+        
+        lines.append(f"  Name: {timeline.GetName()}")
+        lines.append(f"  Duration: {end_frame - start_frame + 1} frames")
+        lines.append(f"  Start frame: {start_frame}")
+        lines.append(f"  End frame: {end_frame}")
+        if verbose:
+            lines.append(f"  Start timecode: {timeline.GetStartTimecode()}")
         
         # Get track counts
         video_tracks = timeline.GetTrackCount("video")
         audio_tracks = timeline.GetTrackCount("audio")
         subtitle_tracks = timeline.GetTrackCount("subtitle")
         
-        print(f"  Tracks - Video: {video_tracks}, Audio: {audio_tracks}, Subtitle: {subtitle_tracks}")
-        
-        # List timeline items if there are any
-        if video_tracks > 0:
-            total_video_items = 0
-            for track_idx in range(1, video_tracks + 1):
-                items = timeline.GetItemListInTrack("video", track_idx)
-                total_video_items += len(items)
-            print(f"  Total video items: {total_video_items}")
-        
-        if audio_tracks > 0:
-            total_audio_items = 0
-            for track_idx in range(1, audio_tracks + 1):
-                items = timeline.GetItemListInTrack("audio", track_idx)
-                total_audio_items += len(items)
-            print(f"  Total audio items: {total_audio_items}")
+        lines.append(f"  Tracks - Video: {video_tracks}, Audio: {audio_tracks}, Subtitle: {subtitle_tracks}")
+        
+        if verbose:
+            # List timeline items if there are any
+            totals = _count_track_items(timeline, {"video": video_tracks, "audio": audio_tracks})
+            if video_tracks > 0:
+                lines.append(f"  Total video items: {totals['video']}")
             
+            if audio_tracks > 0:
+                lines.append(f"  Total audio items: {totals['audio']}")
+            
+    except Exception as e:
+        lines.append(f"Warning: Could not get complete timeline information: {e}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _normalize_media_path(path: str) -> str:
+    """Normalize a media file path for comparison."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _collect_media_pool_paths(media_pool) -> Set[str]:
+    """
+    Collect the file paths of all clips in the media pool.
+    
+    Args:
+        media_pool: DaVinci Resolve media pool
+        
+    Returns:
+        Set of normalized clip file paths (empty if the pool could not be read)
+    """
+    pool_paths = set()
+    try:
+        folders = [media_pool.GetRootFolder()]
+        while folders:
+            folder = folders.pop()
+            for clip in folder.GetClipList() or []:
+                file_path = clip.GetClipProperty("File Path")
+                if file_path:
+                    pool_paths.add(_normalize_media_path(file_path))
+            folders.extend(folder.GetSubFolderList() or [])
     except Exception as e:
-        print(f"Warning: Could not get complete timeline information: {e}")
+        print(f"Warning: Could not read media pool clips: {e}")
+    return pool_paths
+
+
+def _extract_media_paths(otio_file_path: str) -> Set[str]:
+    """
+    Collect all media reference target URLs from an OTIO file.
+    
+    With ijson installed the file is streamed and only target_url strings are
+    materialized; otherwise the whole document is parsed and walked.
+    
+    Args:
+        otio_file_path: Path to the OTIO file
+        
+    Returns:
+        Set of target URLs
+    """
+    media_paths = set()
+    
+    if ijson is not None:
+        with open(otio_file_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if event == 'string' and value and prefix.endswith(_TARGET_URL_SUFFIX):
+                    media_paths.add(value)
+        return media_paths
+    
+    with open(otio_file_path, 'rb') as f:
+        otio_data = _json_loads(f.read())
+    
+    # Iterative walk: no per-node call overhead and no recursion limit on deep files
+    stack = [otio_data]
+    while stack:
+        obj = stack.pop()
+        if type(obj) is dict:
+            target_url = obj.get(_TARGET_URL)
+            if target_url and isinstance(target_url, str):
+                media_paths.add(target_url)
+            stack.extend(obj.values())
+        elif type(obj) is list:
+            stack.extend(obj)
+    return media_paths
+
+
+def _parent_dir(target_url: str) -> str:
+    """
+    Get the directory part of a media path using plain string operations.
+    
+    Handles both / and \\ separators regardless of the current platform, and
+    keeps the separator of a root or drive root like Path.parent does.
+    
+    Args:
+        target_url: Media file path from the OTIO
+        
+    Returns:
+        Parent directory, or an empty string for a bare file name
+    """
+    i = max(target_url.rfind('/'), target_url.rfind('\\'))
+    # Keep the separator for a root ("/a.mov") or drive root ("C:\\a.mov"),
+    # since "C:" alone means the current directory on drive C
+    if i <= 0 or (i == 2 and target_url[1] == ':'):
+        return target_url[:i + 1]
+    return target_url[:i]
+
+
+def _batch_exists(paths: list) -> Dict[str, bool]:
+    """
+    Check which paths exist, listing each parent directory only once.
+    
+    Results are memoized by normalized path, and a successful listing also
+    answers whether that parent directory exists. Deeper paths are checked
+    first so media directories are usually known from their files' listing.
+    Names missing from a listing (e.g. a case or Unicode normalization
+    mismatch) are confirmed with os.path.exists before reporting them absent.
+    
+    Args:
+        paths: File or directory paths to check
+        
+    Returns:
+        Dictionary mapping each path to whether it exists
+    """
+    listings: Dict[str, Optional[Set[str]]] = {}
+    known: Dict[str, bool] = {}
+    result = {}
+    for path in sorted(set(paths), key=lambda p: -os.path.normpath(p).count(os.sep)):
+        normalized = os.path.normpath(path)
+        if normalized in known:
+            result[path] = known[normalized]
+            continue
+        
+        parent, name = os.path.split(normalized)
+        if name in ("", ".", ".."):
+            known[normalized] = result[path] = os.path.exists(normalized)
+            continue
+        
+        parent = parent or "."
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {os.path.normcase(entry.name) for entry in entries}
+                known[parent] = True
+            except OSError:
+                listings[parent] = None
+                known[parent] = os.path.exists(parent)
+        names = listings[parent]
+        if names is not None and os.path.normcase(name) in names:
+            exists = True
+        else:
+            exists = known[parent] and os.path.exists(normalized)
+        known[normalized] = result[path] = exists
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _analysis_cache_file() -> Path:
+    """Location of the analysis cache (raises if there is no home directory)."""
+    return Path.home() / ".cache" / "otioimport" / "analysis.json"
+
+
+def _load_analysis_cache() -> Dict[str, Any]:
+    """Load cached OTIO analyses once per process (empty if missing or unreadable)."""
+    global _analysis_cache
+    if _analysis_cache is None:
+        try:
+            with open(_analysis_cache_file(), 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            _analysis_cache = cache if isinstance(cache, dict) else {}
+        except Exception:
+            _analysis_cache = {}
+    return _analysis_cache
+
+
+def _save_analysis_cache(cache: Dict[str, Any]) -> None:
+    """
+    Write cached OTIO analyses, ignoring any errors.
+    
+    Entries for files that no longer exist are dropped, and only the
+    _ANALYSIS_CACHE_MAX_ENTRIES most recently stored entries are kept.
+    
+    Args:
+        cache: Cached analyses, oldest first
+    """
+    for key in [key for key in cache if not os.path.exists(key)]:
+        del cache[key]
+    for key in list(cache)[:-_ANALYSIS_CACHE_MAX_ENTRIES]:
+        del cache[key]
+    
+    try:
+        cache_file = _analysis_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(".tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(temp_file, cache_file)
+    except Exception as e:
+        log.debug("Could not write OTIO analysis cache: %s", e)
 
 
 def analyze_otio_media_paths(otio_file_path: str) -> Dict[str, Any]:
     """
     Analyze an OTIO file to extract media paths and provide import recommendations.
     
+    Results are cached under ~/.cache/otioimport and reused until the file changes.
+    
     Args:
         otio_file_path: Path to the OTIO file
         
     Returns:
-        Dictionary with analysis results and recommendations
+        Dictionary with analysis results and recommendations. The media_paths
+        and media_directories lists are unordered; sort them for display.
     """
     try:
-        with open(otio_file_path, 'r', encoding='utf-8') as f:
-            otio_data = json.load(f)
-        
-        media_paths = set()
-        media_dirs = set()
-        
-        def extract_media_references(obj):
-            """Recursively extract media references from OTIO structure."""
-            if isinstance(obj, dict):
-                if "target_url" in obj:
-                    target_url = obj["target_url"]
-                    if target_url and isinstance(target_url, str):
-                        media_paths.add(target_url)
-                        media_dir = Path(target_url).parent
-                        media_dirs.add(str(media_dir))
-                
-                for value in obj.values():
-                    extract_media_references(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    extract_media_references(item)
-        
-        extract_media_references(otio_data)
-        
-        # Find the most common media directory
-        common_dir = None
-        if media_dirs:
-            # For now, just use the first one (could be enhanced to find most common)
-            common_dir = list(media_dirs)[0]
+        st = os.stat(otio_file_path)
+        cache_key = os.path.abspath(otio_file_path)
+        cache = _load_analysis_cache()
+        cached = cache.get(cache_key)
+        if (cached and cached.get("version") == _ANALYSIS_CACHE_VERSION
+                and cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size):
+            return cached["analysis"]
+        
+        media_paths = _extract_media_paths(otio_file_path)
+        dir_counts = Counter(
+            parent for target_url in media_paths if (parent := _parent_dir(target_url))
+        )
+        
+        # Recommend the directory holding the most referenced media files
+        common_dir = dir_counts.most_common(1)[0][0] if dir_counts else None
         
         analysis = {
             "total_media_files": len(media_paths),
-            "media_paths": sorted(list(media_paths)),
-            "media_directories": sorted(list(media_dirs)),
+            "media_paths": list(media_paths),
+            "media_directories": list(dir_counts),
             "recommended_source_path": common_dir,
             "requires_source_clips": len(media_paths) > 0
         }
         
+        # Re-insert so the entry counts as most recent when the cache is trimmed
+        cache.pop(cache_key, None)
+        cache[cache_key] = {
+            "version": _ANALYSIS_CACHE_VERSION,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "analysis": analysis
+        }
+        _save_analysis_cache(cache)
+        
         return analysis
         
     except Exception as e:
@@ -159,7 +486,9 @@ def import_otio_timeline(
     import_source_clips: bool = None,
     source_clips_path: str = "",
     source_clips_folders: Optional[list] = None,
-    auto_detect_media: bool = True
+    auto_detect_media: bool = True,
+    prefer_timestamp_names: bool = True,
+    verbose: bool = True
 ) -> bool:
     """
     Import an OTIO timeline file into DaVinci Resolve.
@@ -172,19 +501,17 @@ def import_otio_timeline(
         source_clips_path: Filesystem path to search for source clips (auto-detected if empty)
         source_clips_folders: Media Pool folder objects to search for clips
         auto_detect_media: Whether to automatically analyze OTIO for media paths
+                           (skipped when import_source_clips is True and source_clips_path is given)
+        prefer_timestamp_names: Resolve timeline name conflicts with a timestamp suffix
+                                instead of " (N)" (see get_unique_timeline_name)
+        verbose: Show start timecode and item totals of the imported timeline
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Import DaVinci Resolve API
-        print("Importing DaVinci Resolve API...")
-        import DaVinciResolveScript as dvr_script
-        print("[OK] DaVinciResolveScript module imported successfully")
-        
-        # Connect to DaVinci Resolve
-        print("Connecting to DaVinci Resolve...")
-        resolve = dvr_script.scriptapp("Resolve")
+        # Connect to DaVinci Resolve (reuses the connection from earlier imports)
+        resolve = _get_resolve()
         if not resolve:
             print("ERROR: Could not connect to DaVinci Resolve!")
             print("Make sure:")
@@ -197,6 +524,13 @@ def import_otio_timeline(
         
         # Get the current project
         project_manager = resolve.GetProjectManager()
+        if not project_manager:
+            # The cached connection may be stale (e.g. Resolve was restarted)
+            resolve = force_reconnect()
+            project_manager = resolve.GetProjectManager() if resolve else None
+            if not project_manager:
+                print("ERROR: Lost connection to DaVinci Resolve!")
+                return False
         project = project_manager.GetCurrentProject()
         if not project:
             print("ERROR: No project is currently open!")
@@ -213,7 +547,9 @@ def import_otio_timeline(
         
         # Validate OTIO file
         otio_file = Path(otio_file_path)
-        if not otio_file.exists():
+        try:
+            otio_stat = os.stat(otio_file)
+        except FileNotFoundError:
             print(f"ERROR: OTIO file does not exist: {otio_file}")
             return False
         
@@ -222,9 +558,14 @@ def import_otio_timeline(
         
         print(f"[OK] OTIO file: {otio_file}")
         
-        # Analyze OTIO file for media paths if auto-detection is enabled
+        # Analyze OTIO file for media paths if auto-detection is enabled and there
+        # is something left to detect. With import_source_clips=False the analysis
+        # still decides whether the fallback retries with source clips.
+        needs_analysis = auto_detect_media and (import_source_clips is not True or not source_clips_path)
         analysis = {"requires_source_clips": False, "recommended_source_path": None}
-        if auto_detect_media:
+        media_dir_exists: Dict[str, bool] = {}
+        any_media_exists = False
+        if needs_analysis:
             print("Analyzing OTIO file for media references...")
             analysis = analyze_otio_media_paths(str(otio_file))
             
@@ -232,10 +573,13 @@ def import_otio_timeline(
                 print(f"[WARNING] OTIO analysis failed: {analysis['analysis_error']}")
             else:
                 print(f"[OK] Found {analysis['total_media_files']} media references")
+                # Only directory existence is needed here; files are checked on failure
+                media_dir_exists = {d: os.path.exists(d) for d in analysis['media_directories']}
+                any_media_exists = any(media_dir_exists.values())
                 if analysis['media_directories']:
                     print("Media directories detected:")
                     for media_dir in analysis['media_directories']:
-                        exists = "✓ EXISTS" if Path(media_dir).exists() else "✗ MISSING"
+                        exists = "✓ EXISTS" if media_dir_exists[media_dir] else "✗ MISSING"
                         print(f"  {exists}: {media_dir}")
                     
                     if analysis['recommended_source_path']:
@@ -257,7 +601,7 @@ def import_otio_timeline(
             print(f"[MANUAL] Source clips import: {final_import_clips}")
         
         # Auto-detect source clips path if not provided
-        if not source_clips_path and auto_detect_media and analysis.get('recommended_source_path'):
+        if not source_clips_path and needs_analysis and analysis.get('recommended_source_path'):
             final_source_path = analysis['recommended_source_path']
             print(f"[AUTO-DETECT] Using detected source path: {final_source_path}")
         elif source_clips_path:
@@ -271,8 +615,11 @@ def import_otio_timeline(
         else:
             base_timeline_name = timeline_name
         
-        # Get unique timeline name (adds suffix if needed)
-        final_timeline_name = get_unique_timeline_name(project, base_timeline_name)
+        # Get unique timeline name (adds suffix if needed; collects the existing
+        # names itself so API errors fall back to a timestamp suffix)
+        final_timeline_name = get_unique_timeline_name(
+            project, base_timeline_name, prefer_timestamp=prefer_timestamp_names
+        )
         print(f"[OK] Timeline name: {final_timeline_name}")
         print()
         
@@ -295,7 +642,20 @@ def import_otio_timeline(
         
         # If import fails, try enhanced fallback methods
         if not timeline:
-            if not final_import_clips and analysis.get('requires_source_clips', False):
+            retry_with_clips = not final_import_clips and analysis.get('requires_source_clips', False)
+            if retry_with_clips and media_dir_exists and not any_media_exists:
+                print("[SKIP] All media directories missing - fallback would also fail")
+                retry_with_clips = False
+            
+            if retry_with_clips:
+                # Importing source clips only helps if some referenced media is not in the pool yet
+                pool_paths = _collect_media_pool_paths(media_pool)
+                missing = [p for p in analysis.get('media_paths', []) if _normalize_media_path(p) not in pool_paths]
+                if not missing:
+                    print("[SKIP] All referenced media is already in the media pool - source clips import would not help")
+                    retry_with_clips = False
+            
+            if retry_with_clips:
                 print("Initial import failed. Trying with source clips import enabled...")
                 fallback_options = import_options.copy()
                 fallback_options["importSourceClips"] = True
@@ -313,47 +673,48 @@ def import_otio_timeline(
         if timeline:
             print(f"[OK] Timeline '{timeline.GetName()}' imported successfully!")
             print()
-            display_timeline_info(timeline)
+            display_timeline_info(timeline, verbose=verbose)
             
-            # Verify file size for reference
-            try:
-                file_size = otio_file.stat().st_size
-                print(f"  Source file size: {file_size} bytes")
-            except Exception:
-                pass
+            # File size for reference (from the stat taken during validation)
+            print(f"  Source file size: {otio_stat.st_size} bytes")
             
             return True
         else:
-            print("ERROR: Failed to import timeline from OTIO file!")
-            print()
+            lines = ["ERROR: Failed to import timeline from OTIO file!", ""]
             
             # Enhanced error reporting with media analysis
             if analysis.get('total_media_files', 0) > 0:
-                print("=== MEDIA FILE ANALYSIS ===")
-                print(f"Media files referenced in OTIO: {analysis['total_media_files']}")
-                print("Media file status:")
-                for i, media_path in enumerate(analysis.get('media_paths', []), 1):
-                    exists = Path(media_path).exists()
-                    status = "✓ EXISTS" if exists else "✗ MISSING"
-                    print(f"  {i}. {status}: {media_path}")
-                print()
+                lines.append("=== MEDIA FILE ANALYSIS ===")
+                lines.append(f"Media files referenced in OTIO: {analysis['total_media_files']}")
+                lines.append("Media file status:")
+                media_exists = _batch_exists(analysis.get('media_paths', []))
+                lines.extend(
+                    f"  {i}. {'✓ EXISTS' if media_exists.get(media_path, False) else '✗ MISSING'}: {media_path}"
+                    for i, media_path in enumerate(sorted(analysis.get('media_paths', [])), 1)
+                )
+                lines.append("")
             
-            print("Possible issues:")
-            print("- OTIO file format is not compatible with this version of DaVinci Resolve")
-            print(f"- Timeline name '{final_timeline_name}' conflicts with existing timeline")
-            print("- Media referenced in OTIO file is not found in the project or at specified paths")
-            print("- OTIO file contains unsupported elements or codec")
-            print("- OTIO file may be corrupted or incorrectly formatted")
-            print("- Check DaVinci Resolve console for more detailed error messages")
-            print()
-            print("Enhanced troubleshooting:")
-            print("- Ensure the media files exist at the paths shown above")
-            print("- Import the media files into your DaVinci Resolve Media Pool first")
-            print("- Check that media file paths in the OTIO are accessible from your system")
-            print("- If media files moved, update their location in your project")
+            lines.extend([
+                "Possible issues:",
+                "- OTIO file format is not compatible with this version of DaVinci Resolve",
+                f"- Timeline name '{final_timeline_name}' conflicts with existing timeline",
+                "- Media referenced in OTIO file is not found in the project or at specified paths",
+                "- OTIO file contains unsupported elements or codec",
+                "- OTIO file may be corrupted or incorrectly formatted",
+                "- Check DaVinci Resolve console for more detailed error messages",
+                "",
+                "Enhanced troubleshooting:",
+                "- Ensure the media files exist at the paths shown above",
+                "- Import the media files into your DaVinci Resolve Media Pool first",
+                "- Check that media file paths in the OTIO are accessible from your system",
+                "- If media files moved, update their location in your project",
+            ])
             if analysis.get('recommended_source_path'):
-                print(f"- Try manually specifying source clips path: {analysis['recommended_source_path']}")
-            print("- Verify the OTIO file was generated correctly")
+                lines.append(f"- Try manually specifying source clips path: {analysis['recommended_source_path']}")
+            lines.append("- Verify the OTIO file was generated correctly")
+            
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             
             return False
             
@@ -370,14 +731,16 @@ def import_otio_timeline(
         return False
     except Exception as e:
         print(f"ERROR: An unexpected error occurred: {str(e)}")
-        import traceback
-        print("Traceback:")
-        print(traceback.format_exc())
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Unexpected error in import_otio_timeline", exc_info=True)
+        else:
+            print(f"Set {LOG_LEVEL_ENV_VAR}=DEBUG to show the full traceback.")
         return False
 
 
-def main():
-    """Main function for command-line usage."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
         description="Import OpenTimelineIO files into DaVinci Resolve",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -396,7 +759,13 @@ Examples:
     parser.add_argument('--clips-path', help='Filesystem path to search for source clips')
     parser.add_argument('--version', action='version', version='%(prog)s 1.0.0')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main function for command-line usage."""
+    args = _build_parser().parse_args()
+    configure_logging()
     
     print("=== DaVinci Resolve OTIO Import Tool ===")
     print("Importing OTIO timeline into DaVinci Resolve")
@@ -8,8 +8,11 @@ Takes an OTIO file path as input and imports it into the currently open DaVinci
 import sys
 import os
 import argparse
+import functools
 from pathlib import Path
-from importotio import import_otio_timeline
+
+# Quote characters stripped from paths entered at the prompt
+_QUOTES = ('"', "'")
 
 
 def get_otio_file_path(args_input: str = None) -> str:
@@ -34,9 +37,7 @@ def get_otio_file_path(args_input: str = None) -> str:
             continue
         
         # Handle quoted paths
-        if file_path.startswith('"') and file_path.endswith('"'):
-            file_path = file_path[1:-1]
-        elif file_path.startswith("'") and file_path.endswith("'"):
+        if file_path[:1] in _QUOTES and file_path[-1:] == file_path[:1]:
             file_path = file_path[1:-1]
         
         # Check if file exists
@@ -48,8 +49,16 @@ def get_otio_file_path(args_input: str = None) -> str:
         return file_path
 
 
-def main():
-    """Main function for OTIO import."""
+def _existing_file(file_path: str) -> str:
+    """argparse type check: reject paths that do not exist before anything else is loaded."""
+    if not Path(file_path).exists():
+        raise argparse.ArgumentTypeError(f"File not found: {file_path}")
+    return file_path
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
         description="Import OTIO files into DaVinci Resolve",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -72,13 +81,18 @@ Examples:
         """
     )
     
-    parser.add_argument('input', nargs='?', help='Input OTIO file path (optional, will prompt if not provided)')
+    parser.add_argument('input', nargs='?', type=_existing_file, help='Input OTIO file path (optional, will prompt if not provided)')
     parser.add_argument('--name', '-n', help='Timeline name (optional, uses filename if not provided)')
     parser.add_argument('--import-clips', action='store_true', 
                        help='Force import of source clips into media pool (auto-detected by default)')
     parser.add_argument('--clips-path', help='Filesystem path to search for source clips')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main function for OTIO import."""
+    args = _build_parser().parse_args()
     
     print("=== DaVinci Resolve OTIO Import Tool ===")
     print()
@@ -92,10 +106,10 @@ Examples:
         print("\nOperation cancelled by user.")
         sys.exit(0)
     
-    # Validate file
-    if not Path(otio_file_path).exists():
-        print(f"ERROR: File does not exist: {otio_file_path}")
-        sys.exit(1)
+    # Only load the importer once there is a valid file to import
+    # (command-line paths are checked by argparse, prompted paths by the prompt loop)
+    from importotio import configure_logging, import_otio_timeline
+    configure_logging()
     
     # Import timeline
     print("Starting OTIO import...")
@@ -110,7 +124,10 @@ Examples:
         timeline_name=args.name,
         import_source_clips=import_clips_setting,
         source_clips_path=args.clips_path or "",
-        source_clips_folders=None
+        source_clips_folders=None,
+        prefer_timestamp_names=False,
+        # Full timeline summary only for interactive use
+        verbose=args.input is None
     )
     
     print()